@@ -1,4 +1,5 @@
 # Item 27: Prefer public attributes over private ones
+import sys
 
 
 # In Python, there are only two types of attribute visibility for a class's
@@ -96,6 +97,17 @@ assert baz._MyParentObject__private_field == 71
 # print(baz._MyParentObject__private_field)
 
 
+# Code that does this generically builds the transformed name at runtime and
+# passes it to getattr. Names that appear in source code are interned by the
+# compiler, but strings built at runtime aren't, so intern the name once with
+# sys.intern and reuse it. Dictionary lookups can then match the key by
+# identity instead of comparing the characters.
+
+
+private_name = sys.intern('_%s__private_field' % MyParentObject.__name__)
+assert getattr(baz, private_name) == 71
+
+
 # If you look in the object's attribute dictionary, you'll see that private
 # attributes are actually stored with the names as they appear after the
 # transformation.
@@ -137,9 +149,10 @@ trouble." After all, we're all consenting adults here.
 class MyClass(object):
     def __init__(self, value):
         self.__value = value
+        self.__value_str = str(value)
 
     def get_value(self):
-        return str(self.__value)
+        return self.__value_str
 
 
 foo = MyClass(5)
@@ -15,20 +15,25 @@
 
 
 class FrequencyList(list):
+    __slots__ = ()
+
     def __init__(self, members):
         super().__init__(members)
 
     def frequency(self):
         counts = {}
         for item in self:
-            counts.setdefault(item, 0)
-            counts[item] += 1
+            try:
+                counts[item] += 1
+            except KeyError:
+                counts[item] = 1
         return counts
 
 
 # By subclassing list, you get all of list's standard functionality and
 # preserve the semantics familiar to all Python programmers. Your additional
-# methods can add any custom behaviors you need.
+# methods can add any custom behaviors you need. The empty __slots__ keeps
+# instances as lean as a plain list by not giving each one a __dict__.
 
 
 foo = FrequencyList(['a', 'b', 'a', 'c', 'b', 'a', 'd'])
@@ -43,10 +48,14 @@ print('Frequency:', foo.frequency())
 
 # Now imagine you want to provide an object that feels like a list, allowing
 # indexing, but isn't a list subclass. For example, say you want to provide
-# sequence semantic (like list or tuple) for a binary tree class.
+# sequence semantic (like list or tuple) for a binary tree class. A tree may
+# have a great many nodes, so I declare __slots__ to drop the per-instance
+# __dict__ and keep each node small.
 
 
 class BinaryNode(object):
+    __slots__ = ('value', 'left', 'right')
+
     def __init__(self, value, left=None, right=None):
         self.value = value
         self.left = left
@@ -72,24 +81,42 @@ print(bar.__getitem__(0))
 # To make the BinaryNode class act like a sequence, you can provide a custom
 # implementation of __getitem__ that traverses the object tree depth first.
 
+# Walking the tree again for every index makes each lookup O(n), so iterating
+# over the whole tree with list(tree) or the in operator becomes O(n^2).
+# Instead, I flatten the depth first traversal into a list the first time the
+# tree is indexed and answer every later lookup from that list. The tree is
+# treated as immutable once it has been indexed. Every node you index from
+# caches its own list, covering its whole subtree, so if you change a node you
+# must reset _flat to None on it and on every ancestor that has been indexed.
+# The traversal itself keeps an explicit stack of nodes rather than recursing,
+# so it doesn't pay for a nested generator frame per level of the tree.
+
 
 class IndexableNode(BinaryNode):
-    def __init__(self, value, left=None, right=None):
-        self.value = value
-        self.left = left
-        self.right = right
+    __slots__ = ('_flat',)
 
-    def _search(self, count, index):
-        found = False
-        return (found, count)
-        # ...
-        # returns (found, count)
+    def __init__(self, value, left=None, right=None):
+        super().__init__(value, left, right)
+        self._flat = None
+
+    def _dfs(self):
+        stack = []
+        node = self
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def _flatten(self):
+        if self._flat is None:
+            self._flat = list(self._dfs())
+        return self._flat
 
     def __getitem__(self, index):
-        found, _ = self._search(0, index)
-        if not found:
-            raise IndexError("Index out of range")
-        return found.value
+        return self._flatten()[index]
 
 
 # You can construct your binary tree as usual.
@@ -115,11 +142,17 @@ tree = IndexableNode(
 
 
 print('LRR', tree.left.right.right.value)
-# print('Index 0 = ', tree[0])
-# print('Index 1 = ', tree[1])
-# print('11 in the tree?', 11 in tree)
-# print('17 in the tree?', 17 in tree)
-# print('Tree is ', list(tree))
+print('Index 0 =', tree[0])
+print('Index 1 =', tree[1])
+print('11 in the tree?', 11 in tree)
+print('17 in the tree?', 17 in tree)
+print('Tree is', list(tree))
+# LRR 7
+# Index 0 = 2
+# Index 1 = 5
+# 11 in the tree? True
+# 17 in the tree? False
+# Tree is [2, 5, 6, 7, 10, 11, 15]
 
 
 # The problem is that implementing __getitem__ isn't enough to provide all of
@@ -135,26 +168,28 @@ print('LRR', tree.left.right.right.value)
 
 
 class SequenceNode(IndexableNode):
+    __slots__ = ()
+
     def __len__(self):
-        _, count = self._search(0, None)
-        return count
+        return len(self._flatten())
 
-tree = IndexableNode(
+tree = SequenceNode(
     10,
-    left=IndexableNode(
+    left=SequenceNode(
         5,
-        left=IndexableNode(2),
-        right=IndexableNode(
+        left=SequenceNode(2),
+        right=SequenceNode(
             6,
-            right=IndexableNode(7)
+            right=SequenceNode(7)
         )
     ),
-    right=IndexableNode(
-        15, left=IndexableNode(11)
+    right=SequenceNode(
+        15, left=SequenceNode(11)
     )
 )
 
 print('Tree has %d nodes' % len(tree))
+# Tree has 7 nodes
 
 
 # Unfortunately, this still isn't enought. Also missing are the count and
@@ -169,14 +204,13 @@ print('Tree has %d nodes' % len(tree))
 # module will tell you something is wrong.
 
 
-# from collections.abc import Sequence
-from collections import Sequence
+from collections.abc import Sequence
 
 
 class BadType(Sequence):
     pass
 
-foo = BadType()
+# foo = BadType()
 # TypeError: Can't instantiate abstract class BadType with abstract methods __getitem__, __len__
 
 
@@ -186,25 +220,30 @@ foo = BadType()
 
 
 class BetterNode(SequenceNode, Sequence):
-    pass
+    __slots__ = ()
 
-tree = IndexableNode(
+
+tree = BetterNode(
     10,
-    left=IndexableNode(
+    left=BetterNode(
         5,
-        left=IndexableNode(2),
-        right=IndexableNode(
+        left=BetterNode(2),
+        right=BetterNode(
             6,
-            right=IndexableNode(7)
+            right=BetterNode(7)
         )
     ),
-    right=IndexableNode(
-        15, left=IndexableNode(11)
+    right=BetterNode(
+        15, left=BetterNode(11)
     )
 )
 
 print('Index of 7 is', tree.index(7))
 print('Count of 10 is', tree.count(10))
+print('Is a Sequence?', isinstance(tree, Sequence))
+# Index of 7 is 3
+# Count of 10 is 1
+# Is a Sequence? True
 
 
 # The benefit of using these abstract base class is even greater for more
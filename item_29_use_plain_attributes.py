@@ -165,6 +165,9 @@ r3 = BoundedResistance(1e3)
 # before object construction has completed.
 
 # You can even use @property to make attributes from parent classes immutable.
+# Checking the instance dictionary directly, rather than calling hasattr,
+# avoids raising and then swallowing an AttributeError for the missing _ohms
+# attribute on the first assignment.
 
 
 class FixedResistance(Resistor):
@@ -177,7 +180,7 @@ class FixedResistance(Resistor):
 
     @ohms.setter
     def ohms(self, ohms):
-        if hasattr(self, '_ohms'):
+        if '_ohms' in self.__dict__:
             raise AttributeError("Can't set attribute")
         self._ohms = ohms
 
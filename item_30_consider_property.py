@@ -1,6 +1,5 @@
 # Item 30: Consider @property instead of refactoring attributes
-from datetime import timedelta
-import datetime
+import time
 
 
 # The built-in @property decorator makes it easy for simple accesses of an
@@ -19,8 +18,8 @@ import datetime
 
 class Bucket(object):
     def __init__(self, period):
-        self.period_delta = timedelta(seconds=period)
-        self.reset_time = datetime.datetime.now()
+        self.period_ns = period * 1000000000
+        self.reset_time_ns = time.monotonic_ns()
         self.quota = 0
 
     def __repr__(self):
@@ -29,13 +28,16 @@ class Bucket(object):
 
 # The leaky bucket algorithm works by ensuring that, whenever the bucket is
 # filled, the amount of quota does not carry over from one period to the next.
+# Times are kept as integer nanoseconds from the monotonic clock, so checking
+# whether the period has expired is plain integer arithmetic and isn't thrown
+# off by changes to the wall clock.
 
 
 def fill(bucket, amount):
-    now = datetime.datetime.now()
-    if now - bucket.reset_time > bucket.period_delta:
+    now = time.monotonic_ns()
+    if now - bucket.reset_time_ns > bucket.period_ns:
         bucket.quota = 0
-        bucket.reset_time = now
+        bucket.reset_time_ns = now
     bucket.quota += amount
 
 
@@ -44,8 +46,8 @@ def fill(bucket, amount):
 
 
 def deduct(bucket, amount):
-    now = datetime.datetime.now()
-    if now - bucket.reset_time > bucket.period_delta:
+    now = time.monotonic_ns()
+    if now - bucket.reset_time_ns > bucket.period_ns:
         return False
     if bucket.quota - amount < 0:
         return False
@@ -93,13 +95,17 @@ print(bucket)
 # quota in the first place.
 
 # To fix this, I can change the class to keep track of the max_quota issued in
-# the period and the quota_consumed in the period.
+# the period and the quota_consumed in the period. The set of attributes is
+# now fixed, so I also list them in __slots__ to drop the per-instance
+# __dict__.
 
 
 class Bucket(object):
+    __slots__ = ('period_ns', 'reset_time_ns', 'max_quota', 'quota_consumed')
+
     def __init__(self, period):
-        self.period_delta = timedelta(seconds=period)
-        self.reset_time = datetime.datetime.now()
+        self.period_ns = period * 1000000000
+        self.reset_time_ns = time.monotonic_ns()
         self.max_quota = 0
         self.quota_consumed = 0
 
@@ -177,6 +183,43 @@ print('Still', bucket)
 # @property methods, it's probably time to refactor your class instead of
 # further paving over your code's poor design.
 
+# For example, once you're free to change every caller, the leaky bucket can
+# be replaced by the generic cell rate algorithm (GCRA). Instead of tracking
+# the reset time, the max quota and the quota consumed, it keeps a single
+# theoretical arrival time (tat): the point at which all quota handed out so
+# far will have drained. Each unit of quota pushes tat forward by inc
+# nanoseconds, and a deduction is refused if that would put tat more than
+# one period ahead of now. The bucket refills itself as time passes, so
+# there's no separate fill step and no reset branch.
+
+
+class Bucket(object):
+    __slots__ = ('tat', 'inc', 'burst')
+
+    def __init__(self, period, quota):
+        self.burst = period * 1000000000
+        self.inc = self.burst // quota
+        self.tat = time.monotonic_ns()
+
+    def deduct(self, amount):
+        now = time.monotonic_ns()
+        tat = max(self.tat, now)
+        new_tat = tat + amount * self.inc
+        if new_tat - now > self.burst:
+            return False
+        self.tat = new_tat
+        return True
+
+    def __repr__(self):
+        return 'Bucket(inc=%d, burst=%d)' % (self.inc, self.burst)
+
+
+bucket = Bucket(60, 100)
+print('Had 99 quota' if bucket.deduct(99) else 'Not enough for 99 quota')
+print('Had 3 quota' if bucket.deduct(3) else 'Not enough for 3 quota')
+# Had 99 quota
+# Not enough for 3 quota
+
 
 # Things to remember
 
@@ -13,6 +13,8 @@ import weakref
 
 
 class Homework(object):
+    __slots__ = ('_grade',)
+
     def __init__(self):
         self._grade = 0
 
@@ -183,9 +185,8 @@ class Exam(object):
 # dictionary.
 
 class Grade(object):
-    def __int__(self):
+    def __init__(self):
         self._values = {}
-        # self._values = weakref.WeakKeyDictionary()
 
     def __get__(self, instance, owner):
         if instance is None:
@@ -193,10 +194,8 @@ class Grade(object):
         return self._values.get(instance, 0)
 
     def __set__(self, instance, value):
-        # if not (0 <= value <= 100):
-        #     raise ValueError('Grade must be between 0 and 100')
-        # self._values.set(instance, value)  # [instance] = value
-        # self._values[instance] = value
+        if not (0 <= value <= 100):
+            raise ValueError('Grade must be between 0 and 100')
         self._values[instance] = value
 
 
@@ -214,15 +213,27 @@ class Grade(object):
 # that the _values dictionary will be empty when all Exam instances are no
 # longer in use.
 
-# class Grade(object):
-#     def __int__(self):
-#         self._values = weakref.WeakKeyDictionary()
+class Grade(object):
+    def __init__(self):
+        self._values = weakref.WeakKeyDictionary()
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return self._values.get(instance, 0)
+
+    def __set__(self, instance, value):
+        if not (0 <= value <= 100):
+            raise ValueError('Grade must be between 0 and 100')
+        self._values[instance] = value
 
 # Using this implementation of the Grade descriptor, everything works as
 # expected.
 
 
 class Exam(object):
+    __slots__ = ('__weakref__',)
+
     math_grade = Grade()
     writing_grade = Grade()
     science_grade = Grade()
@@ -234,8 +245,92 @@ second_exam = Exam()
 second_exam.writing_grade = 75
 print('First ', first_exam.writing_grade, 'is right')
 print('Second', second_exam.writing_grade, 'is right')
-# TODO: there is a bug:
-# AttributeError: 'Grade' object has no attribute '_values'
+# First  82 is right
+# Second 75 is right
+
+
+# Every access still goes through the WeakKeyDictionary, though: Python
+# hashes the Exam instance, probes the dictionary, and dereferences a weak
+# reference. Since Python 3.6, a descriptor can learn the name it was
+# assigned to with __set_name__, which is called once when the owning class
+# is created. With that name, Grade can store each value in the instance's
+# own __dict__ under a protected name, like a plain attribute. Nothing
+# outside the instance holds a reference to it, so there's no leak and no
+# need for weakref.
+
+
+class Grade(object):
+    def __set_name__(self, owner, name):
+        self.internal_name = '_' + name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.__dict__.get(self.internal_name, 0)
+
+    def __set__(self, instance, value):
+        if not (0 <= value <= 100):
+            raise ValueError('Grade must be between 0 and 100')
+        instance.__dict__[self.internal_name] = value
+
+
+class Exam(object):
+    math_grade = Grade()
+    writing_grade = Grade()
+    science_grade = Grade()
+
+
+first_exam = Exam()
+first_exam.writing_grade = 82
+second_exam = Exam()
+second_exam.writing_grade = 75
+print('First ', first_exam.writing_grade, 'is right')
+print('Second', second_exam.writing_grade, 'is right')
+print(first_exam.__dict__)
+# First  82 is right
+# Second 75 is right
+# {'_writing_grade': 82}
+
+
+# When the grade names are all known up front, you can go one step further
+# and build the class with a __slots__ entry for each value's storage. Here,
+# make_exam generates such a class with type. The descriptor reads and
+# writes its slot with getattr and setattr, so instances have no __dict__ at
+# all. Note that type calls __set_name__ on the descriptors just like a class
+# statement does.
+
+
+class SlotGrade(object):
+    def __set_name__(self, owner, name):
+        self.internal_name = '_' + name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return getattr(instance, self.internal_name, 0)
+
+    def __set__(self, instance, value):
+        if not (0 <= value <= 100):
+            raise ValueError('Grade must be between 0 and 100')
+        setattr(instance, self.internal_name, value)
+
+
+def make_exam(*names):
+    class_dict = {'__slots__': tuple('_' + name for name in names)}
+    for name in names:
+        class_dict[name] = SlotGrade()
+    return type('Exam', (object,), class_dict)
+
+
+Exam = make_exam('math_grade', 'writing_grade', 'science_grade')
+first_exam = Exam()
+first_exam.writing_grade = 82
+print('Writing', first_exam.writing_grade)
+print('Math   ', first_exam.math_grade)
+print('Has __dict__?', hasattr(first_exam, '__dict__'))
+# Writing 82
+# Math    0
+# Has __dict__? False
 
 
 # Things to remember
@@ -246,3 +341,5 @@ print('Second', second_exam.writing_grade, 'is right')
 #     memory leaks.
 # 3. Don't get bogged down trying to understand exactly how __getattribute__
 #     uses the descriptor protocol for getting and setting attributes.
+# 4. In Python 3.6 and later, use __set_name__ to let a descriptor store its
+#     per-instance values on the instance itself.
@@ -21,13 +21,15 @@ class LazyDB(object):
         self.exists = 5
 
     def __getattr__(self, name):
-        value = 'Value for %s' %  name
-        setattr(self, name, value)
+        value = 'Value for %s' % name
+        self.__dict__[name] = value
         return value
 
 
 # Here, I access the missing property foo. This causes Python to call the
 # __getattr__ method above, which mutates the instance dictionary __dict__.
+# Writing to __dict__ directly, rather than calling setattr, skips the
+# attribute assignment machinery since all I want is to cache the value.
 data = LazyDB()
 print('Before:', data.__dict__)
 print('foo:   ', data.foo)
@@ -63,9 +65,9 @@ print('foo:   ', data.foo)
 # The exists attribute is present in the instance dictionary, so __getattr__
 # is never called for it. The foo attribute is not in the instance dictionary
 # initially, so __getattr__ is called the first time. But the call to
-# __getattr__ for foo also does a setattr, which populates foo in the instance
-# dictionary. This is why the second time I access foo there isn't a call to
-# __getattr__.
+# __getattr__ for foo also stores the value in self.__dict__, which populates
+# foo in the instance dictionary. This is why the second time I access foo
+# there isn't a call to __getattr__.
 
 # This behavior is especially helpful for use cases like lazily accessing
 # schemaless data. __getattr__ runs once to do the hard work of loading a
@@ -219,15 +221,20 @@ data = BrokenDictionaryDB({'foo': 3})
 # __getattribute__ to run again, which access self._data again, and so on.
 # The solution is to use the super().__getattribute__ method on your instance
 # to fetch values from the instance attribute dictionary. This avoids the
-# recursion.
+# recursion. Since the parent here is object, calling
+# object.__getattribute__ directly does the same thing without creating a
+# super object on every access, and keeping _data in a slot means the lookup
+# reads a fixed field instead of probing an instance dictionary.
 
 
 class DictionaryDB(object):
+    __slots__ = ('_data',)
+
     def __init__(self, data):
         self._data = data
 
     def __getattribute__(self, name):
-        data_dict = super().__getattribute__('_data')
+        data_dict = object.__getattribute__(self, '_data')
         return data_dict[name]
 
 data = DictionaryDB({'foo': 3})
@@ -81,30 +81,39 @@ class MyClass(object, metaclass=Meta):
 # to represent any type of multi-sided polygon. You can do this by defining a
 # special validating metaclass and using it in the base class of your polygon
 # class hierarchy. Note that it's important not to apply the same validation
-# to the base class.
+# to the base class. Here, any class that doesn't set sides is treated as
+# abstract, which covers intermediate base classes as well as Polygon.
 
 
 class ValidatePolygon(type):
     def __new__(meta, name, bases, class_dict):
-        '''Don't validate the abstract Polygon class'''
-        if bases != (object,):
-            if class_dict['sides'] < 3:
+        '''Don't validate abstract classes that leave sides unset'''
+        sides = class_dict.get('sides')
+        if sides is not None:
+            if sides < 3:
                 raise ValueError('Polygons need 3+ sides')
+            class_dict['interior_angles'] = (sides - 2) * 180
         return type.__new__(meta, name, bases, class_dict)
 
 
 class Polygon(object, metaclass=ValidatePolygon):
     sides = None  # Specified by subclass
-
-    @classmethod
-    def interior_angles(cls):
-        return (cls.sides - 2) * 180
+    interior_angles = None  # Computed by the metaclass
 
 
 class Triangle(Polygon):
     sides = 3
 
 
+# Because sides is fixed once the class statement finishes, the metaclass
+# also computes interior_angles at that point and stores it as a plain class
+# attribute, so reading it doesn't need a method call.
+
+
+print('Triangle angles', Triangle.interior_angles)
+# Triangle angles 180
+
+
 # If you try to define a polygon with fewer that three sides, the validation
 # will cause the class statement to fail immediately after the class statement
 # body. This means your program will not even be able to start running when
@@ -113,14 +122,49 @@ class Triangle(Polygon):
 
 print('Before class')
 
-
-class Line(Polygon):
-    print('Before side')
-    sides = 1
-    print('After side')
-print('After class')
+try:
+    class Line(Polygon):
+        print('Before side')
+        sides = 1
+        print('After side')
+    print('After class')
+except ValueError as e:
+    print('ValueError:', e)
 # Before class
 # Before side
+# After side
+# ValueError: Polygons need 3+ sides
+
+
+# Python 3.6 added a simpler hook for this: the __init_subclass__ class
+# method, which runs each time a subclass is defined. It gives you the same
+# validation without a custom metaclass, so class creation goes through the
+# standard type machinery and subclasses stay free to mix in classes that
+# use a different metaclass.
+
+
+class BetterPolygon(object):
+    sides = None  # Specified by subclass
+    interior_angles = None  # Computed when the subclass is defined
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.sides is None or cls.sides < 3:
+            raise ValueError('Polygons need 3+ sides')
+        cls.interior_angles = (cls.sides - 2) * 180
+
+
+class Hexagon(BetterPolygon):
+    sides = 6
+
+
+print('Hexagon angles', Hexagon.interior_angles)
+try:
+    class Point(BetterPolygon):
+        sides = 1
+except ValueError as e:
+    print('ValueError:', e)
+# Hexagon angles 720
 # ValueError: Polygons need 3+ sides
 
 
@@ -131,5 +175,7 @@ print('After class')
 # 2. Metaclass have slightly different syntax in Python 2 vs. Python 3.
 # 3. The __new__ method of metaclasses is run after the class statement's
 #     entire body has been processed.
+# 4. In Python 3.6 and later, __init_subclass__ can validate subclasses
+#     without the cost and conflicts of a custom metaclass.
 
 
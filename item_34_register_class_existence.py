@@ -1,5 +1,6 @@
 # Item 34: Register class existence with metaclass
 import json
+import weakref
 
 
 # Another common use of metaclass is to automatically register types in your
@@ -86,17 +87,25 @@ print('After:      ', after)
 # corresponding Python object.
 
 # To do this, I include the serialized object's class name in the JSON data.
+# The name never changes after the class is defined, so I encode the
+# constant start of the JSON object once per subclass in __init_subclass__.
+# Each call to serialize then only has to encode the arguments. The base
+# class is never passed to its own __init_subclass__, so it spells out its
+# prefix in the class body.
 
 
 class BetterSerializable(object):
+    _json_prefix = '{"class": "BetterSerializable", "args": '
+
     def __init__(self, *args):
         self.args = args
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._json_prefix = '{"class": %s, "args": ' % json.dumps(cls.__name__)
+
     def serialize(self):
-        return json.dumps({
-            'class': self.__class__.__name__,
-            'args': self.args
-        })
+        return self._json_prefix + json.dumps(self.args) + '}'
 
     def __repr__(self):
         return 'Point2D(%d, %d)' % (self.x, self.y)
@@ -104,10 +113,14 @@ class BetterSerializable(object):
 
 # Then, I can maintain a mapping of class names back to constructors for those
 # objects. The general deserialize function will work for any class passed to
-# register_class.
+# register_class. The mapping holds its classes weakly, and deserialize looks
+# the class up by name on every call rather than keeping it anywhere else. So
+# a class that was created dynamically and is no longer used anywhere else can
+# still be garbage collected instead of being kept alive by the registry
+# forever.
 
 
-registry = {}
+registry = weakref.WeakValueDictionary()
 
 
 def register_class(target_class):
@@ -233,6 +246,36 @@ print('After:      ', after)
 # object-relationship mappings (ORMs), plug-in systems, and system hooks.
 
 
+# Since Python 3.6, the __init_subclass__ hook gives the same guarantee
+# without a custom metaclass. Python calls it for every subclass right after
+# the class body runs, so registration can't be forgotten. It also avoids
+# metaclass conflicts when a serializable class needs another base that has
+# its own metaclass, such as an abstract base class.
+
+
+class AutoSerializable(BetterSerializable):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        register_class(cls)
+
+
+class Vector2D(AutoSerializable):
+    def __init__(self, x, y):
+        super().__init__(x, y)
+        self.x, self.y = x, y
+
+    def __repr__(self):
+        return 'Vector2D(%d, %d)' % (self.x, self.y)
+
+
+v2 = Vector2D(4, -1)
+data = v2.serialize()
+print('Serialized: ', data)
+print('After:      ', deserialize(data))
+# Serialized:  {"class": "Vector2D", "args": [4, -1]}
+# After:       Vector2D(4, -1)
+
+
 # Things to remember
 
 # 1. Class registration is a helpful pattern for building modular Python
@@ -241,3 +284,5 @@ print('After:      ', after)
 #     base class is subclassed in a program.
 # 3. Using metaclass for class registration avoids errors by ensuring that
 #     you never miss a registration call.
+# 4. The __init_subclass__ hook provides the same automatic registration
+#     without a metaclass.
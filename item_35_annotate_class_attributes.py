@@ -1,4 +1,5 @@
 # Item 35: Annotate class attributes with metaclass
+import sys
 
 
 # One more useful feature enable by metaclasses is the ability to modify or
@@ -16,7 +17,7 @@
 class Field(object):
     def __init__(self, name):
         self.name = name
-        self.internal_name = '_' + self.name
+        self.internal_name = sys.intern('_' + self.name)
 
     def __get__(self, instance, instance_type):
         if instance is None:
@@ -72,7 +73,9 @@ print('After:  ', repr(foo.first_name), foo.__dict__)
 # the class statement directly and take action as soon as a class body is
 # finished. In this case, I can use the metalcass to assign Field.name and
 # Field.internal_name on the descriptor automatically instead of manually
-# specifying the field name multiple times.
+# specifying the field name multiple times. I intern the internal name
+# because it's built at runtime, and every getattr and setattr the
+# descriptor does uses it as an instance dictionary key.
 
 
 class Meta(type):
@@ -80,7 +83,7 @@ class Meta(type):
         for key, value in class_dict.items():
             if isinstance(value, Field):
                 value.name = key
-                value.internal_name = '_' + key
+                value.internal_name = sys.intern('_' + key)
         cls = type.__new__(meta, name, bases, class_dict)
         return cls
 
@@ -137,6 +140,68 @@ print('After:  ', repr(foo.first_name), foo.__dict__)
 # After:   'Euler' {'_first_name': 'Euler'}
 
 
+# Every instance of BetterCustomer still carries its own __dict__, and every
+# read goes through getattr with a string key. For a table with thousands of
+# rows, the metaclass can do better: it already knows every field name before
+# the class exists, so it can declare them as __slots__ too. Each Field then
+# keeps a reference to the member descriptor that the slot creates and reads
+# and writes the value through it directly.
+
+
+class SlotField(object):
+    def __init__(self):
+        self.name = None
+        self.internal_name = None
+        self.slot = None
+
+    def __get__(self, instance, instance_type):
+        if instance is None:
+            return self
+        return self.slot.__get__(instance, instance_type)
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
+class SlotMeta(type):
+    def __new__(meta, name, bases, class_dict):
+        fields = [(key, value) for key, value in class_dict.items()
+                  if isinstance(value, SlotField)]
+        slots = list(class_dict.get('__slots__', ()))
+        for key, value in fields:
+            value.name = key
+            value.internal_name = sys.intern('_' + key)
+            slots.append(value.internal_name)
+        class_dict['__slots__'] = tuple(slots)
+        cls = type.__new__(meta, name, bases, class_dict)
+        for key, value in fields:
+            value.slot = cls.__dict__[value.internal_name]
+        return cls
+
+
+class SlotDatabaseRow(object, metaclass=SlotMeta):
+    __slots__ = ()
+
+
+class SlotCustomer(SlotDatabaseRow):
+    first_name = SlotField()
+    last_name = SlotField()
+    prefix = SlotField()
+    suffix = SlotField()
+
+
+# The class reads the same as BetterCustomer, but its instances no longer
+# have a __dict__ at all.
+
+
+foo = SlotCustomer()
+foo.first_name = 'Gauss'
+print('After:  ', repr(foo.first_name), foo._first_name)
+print('Has __dict__?', hasattr(foo, '__dict__'))
+# After:   'Gauss' Gauss
+# Has __dict__? False
+
+
 # Things to remember
 
 # 1. Metaclass enable you to modify a class's attributes before the class is
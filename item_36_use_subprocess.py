@@ -90,6 +90,16 @@ print('Exit status', proc.poll())
 # Exit status 0
 
 
+# Polling only pays off when there is real work to overlap with the child.
+# When there isn't, don't spin on poll. The wait method blocks in the kernel
+# until the child exits, and uses no CPU while it waits.
+
+
+proc = subprocess.Popen(['sleep', '0.0001'])
+print('Exit status', proc.wait())
+# Exit status 0
+
+
 # Decoupling the child process from the parent means that the parent process
 # is free to run many child processes in parallel. You can do this by starting
 # all the child processes together upfront.
@@ -130,12 +140,17 @@ print('Finished in %.3f seconds' % (end-start))
 # would be user input, a file handle, a network socket, etc.:
 
 
+# The child's environment is the same for every call, so I build it once
+# rather than copying os.environ each time a process starts.
+
+
+OPENSSL_ENV = {**os.environ, 'password': b'\xe24U\n\xd0Q13S\x11'}
+
+
 def run_openssl(data):
-    env = os.environ.copy()
-    env['password'] = b'\xe24U\n\xd0Q13S\x11'
     proc = subprocess.Popen(
         ['openssl', 'enc', '-des3', '-pass', 'env:password'],
-        env=env,
+        env=OPENSSL_ENV,
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE
     )
@@ -188,8 +203,19 @@ for _ in range(3):
     proc = run_openssl(data)
     input_procs.append(proc)
     hash_proc = run_md5(proc.stdout)
+    proc.stdout.close()  # md5sum owns the read end now
     hash_procs.append(hash_proc)
 
+# Closing the parent's copy of each openssl stdout matters. The encrypted
+# bytes should flow straight from one child to the next through the kernel
+# pipe, without passing through Python. If the parent keeps the read end
+# open, the communicate call below competes with md5sum for the same bytes,
+# and md5sum sometimes hashes an empty stream.
+
+# Popen itself is not the bottleneck here. On Linux, subprocess already
+# starts children with vfork or posix_spawn when it can, so calling
+# os.posix_spawn by hand would gain little and lose the pipe management.
+
 # The I/O between the child processes will happen automatically once you get
 # them started. All you need to do is wait for them to finish and print the
 # final output.
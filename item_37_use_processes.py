@@ -0,0 +1,39 @@
+# Item 37: Use threads for blocking I/O, avoid for parallelism
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+# This is the process pool counterpart of the threads in item_37_use_threads.
+# Each factorization runs in its own child interpreter, and each child has its
+# own GIL. The function the pool calls must be defined at module level so it
+# can be pickled.
+
+# On macOS and Windows, child processes are started with spawn, which imports
+# this script again in every child. So everything outside the __main__ check
+# below only defines things; the timing runs once, in the parent.
+
+
+def factorize(number):
+    for i in range(1, number + 1):
+        if number % i == 0:
+            yield i
+
+
+def factorize_all(number):
+    return list(factorize(number))
+
+
+numbers = [2139079, 1214759, 1516637, 1852285]
+
+if __name__ == '__main__':
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=len(numbers)) as pool:
+        results = list(pool.map(factorize_all, numbers))
+    end = time.time()
+    print('Took %.3f seconds' % (end - start))
+
+# Whether this beats the serial loop depends on your machine. With one free
+# core per number, the wall time can approach that of the slowest single
+# factorization. With fewer cores, or for work this small, the cost of
+# starting the child processes can eat the gain. Measure before you rely on
+# it.
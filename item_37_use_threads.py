@@ -90,8 +90,14 @@ print('Tool %.3f seconds' % (end - start))
 # There are ways to get CPython to utilize multiple cores, but it doesn't
 # work with the standard Thread class (see Item 41:
 # "Consider  concurrent.futures for true parallelism") and it can require
-# substantial effort. Knowing these limitations you may wonder, why does
-# Python support threads at all? There are two good reasons.
+# substantial effort. The companion script item_37_use_processes.py runs the
+# same factorizations in a ProcessPoolExecutor, where each child interpreter
+# has its own GIL. It lives in its own file because, on macOS and Windows,
+# child processes are started with spawn, which imports the main script again
+# in every child. Each child would then re-run every demo in this module.
+
+# Knowing these limitations you may wonder, why does Python support threads
+# at all? There are two good reasons.
 
 # First, multiple threads make it easy for your program to seem like it's
 # doing multiple things at the same time. Managing the juggling act of
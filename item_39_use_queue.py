@@ -4,8 +4,21 @@ from threading import Thread
 from threading import Lock
 from time import sleep
 from queue import Queue
+import asyncio
 import time
 
+# uvloop replaces asyncio's event loop with one built on libuv, which
+# dispatches ready tasks in C. The asyncio pipeline at the end of this item
+# uses it when it's installed and falls back to the standard loop otherwise.
+# uvloop.run only exists in uvloop 0.18 and later, so an older uvloop also
+# falls back.
+try:
+    import uvloop
+except ImportError:
+    run_event_loop = asyncio.run
+else:
+    run_event_loop = getattr(uvloop, 'run', asyncio.run)
+
 # Python programs that do many things concurrently often need to coordinate
 # their work. One of the most useful arrangements for concurrent work is a
 # pipeline of functions.
@@ -37,6 +50,8 @@ import time
 
 
 class MyQueue(object):
+    __slots__ = ('items', 'lock')
+
     def __init__(self):
         self.items = deque()
         self.lock = Lock()
@@ -125,6 +140,7 @@ threads = [
 
 
 for thread in threads:
+    thread.daemon = True  # Worker never exits, so don't wait for it at exit
     thread.start()
 for _ in range(1000):
     download_queue.put(object())
@@ -174,8 +190,11 @@ print('Processed', processed, 'items after polling', polled, 'items')
 # functionality you need to solve these problems.
 
 # Queue eliminates the busy waiting in the worker by making the get method
-# block until new data is available. For example, here I start a thread that
-# waits for some input data on a queue:
+# block until new data is available. Internally, get waits on a
+# threading.Condition and put notifies it. A waiting consumer therefore wakes
+# as soon as an item arrives, rather than on its next 10 millisecond poll, and
+# uses no CPU while it waits. For example, here I start a thread that waits
+# for some input data on a queue:
 
 queue = Queue()
 
@@ -277,28 +296,54 @@ print('Producer done')
 # I can put all of these behaviors together into a Queue subclass that also
 # tells the worker thread when it should stop processing. Here, I define a
 # close method that adds a special item to the queue that indicates these will
-# be no more input items after it:
+# be no more input items after it. Each worker exits after it takes one
+# special item, so when several workers share a queue, close puts one for
+# each of them in a single batch (see put_many below):
 
 
 class ClosableQueue(Queue):
     SENTINEL = object()
 
-    def close(self):
-        self.put(self.SENTINEL)
+    def close(self, workers=1):
+        self.put_many([self.SENTINEL] * workers)
 
 # Then, I define an iterator for the queue that looks for this special object
 # and stops iteration when it's found. This __iter__ method also calls
 # task_done at appropriate times, letting me track the progress of work on the
-# queue.
+# queue. The generator binds the methods and the sentinel to local names
+# once, so the loop doesn't repeat those attribute lookups for every item.
     def __iter__(self):
+        get, task_done, sentinel = self.get, self.task_done, self.SENTINEL
         while True:
-            item = self.get()
+            item = get()
             try:
-                if item is self.SENTINEL:
+                if item is sentinel:
                     return  # Cause the thread to exit
                 yield item
             finally:
-                self.task_done()
+                task_done()
+
+# Each call to put acquires the queue's lock and notifies its condition
+# variables once. When a producer has many items ready at the same time,
+# put_many adds them under a single acquisition of the lock. It uses the
+# same mutex and conditions as Queue itself, so it mixes safely with put and
+# get. While the queue is full, it wakes a consumer before waiting for
+# room. The items are gathered into a list before the lock is taken, so a
+# slow or failing iterable never runs while consumers are locked out. The
+# final notify sits in a finally block, so items that were already added
+# always wake their consumers.
+    def put_many(self, items):
+        items = list(items)
+        with self.not_full:
+            try:
+                for item in items:
+                    while 0 < self.maxsize <= self._qsize():
+                        self.not_empty.notify()
+                        self.not_full.wait()
+                    self._put(item)
+                    self.unfinished_tasks += 1
+            finally:
+                self.not_empty.notify_all()
 
 # Now, I can redefine my worker thread to rely on the behavior of the
 # ClosableQueue class. The thread will exit once the for loop is exhausted.
@@ -310,19 +355,21 @@ class StoppableWorker(Thread):
         self.func = func
         self.in_queue = in_queue
         self.out_queue = out_queue
-        self.polled_count = 0
-        self.work_done = 0
 
     def run(self):
         for item in self.in_queue:
             result = self.func(item)
             self.out_queue.put(result)
 
-# Here, I re-create the set of worker threads using the new worker class:
+# Here, I re-create the set of worker threads using the new worker class.
+# ClosableQueue accepts Queue's maxsize, so I also bound the queues between
+# the phases. A phase that falls behind now makes the one before it block
+# on put, rather than letting its backlog grow without limit. The done_queue
+# stays unbounded because nothing consumes it until the end.
 
-download_queue = ClosableQueue()
-resize_queue = ClosableQueue()
-upload_queue = ClosableQueue()
+download_queue = ClosableQueue(maxsize=100)
+resize_queue = ClosableQueue(maxsize=100)
+upload_queue = ClosableQueue(maxsize=100)
 done_queue = ClosableQueue()
 
 threads = [
@@ -338,8 +385,7 @@ threads = [
 for thread in threads:
     thread.start()
 
-for _ in range(1000):
-    download_queue.put(object())
+download_queue.put_many([object() for _ in range(1000)])
 
 download_queue.close()
 
@@ -357,6 +403,47 @@ print(done_queue.qsize(), 'item finished')
 # 1000 item finished
 
 
+# The same pipeline can also run on the asyncio built-in module. Each phase
+# becomes a coroutine instead of a thread, and asyncio.Queue provides the
+# same blocking get, buffer size, and join behavior as Queue. The phase
+# functions still do blocking I/O, so asyncio.to_thread (Python 3.9 and
+# later) runs each call on a worker thread. That keeps a slow download from
+# stalling the event loop.
+
+
+async def run_phase(func, in_queue, out_queue):
+    while True:
+        item = await in_queue.get()
+        result = await asyncio.to_thread(func, item)
+        await out_queue.put(result)
+        in_queue.task_done()
+
+
+async def run_pipeline(count):
+    download_queue = asyncio.Queue(maxsize=100)
+    resize_queue = asyncio.Queue(maxsize=100)
+    upload_queue = asyncio.Queue(maxsize=100)
+    done_queue = asyncio.Queue()
+    phases = [
+        asyncio.create_task(run_phase(download, download_queue, resize_queue)),
+        asyncio.create_task(run_phase(resize, resize_queue, upload_queue)),
+        asyncio.create_task(run_phase(upload, upload_queue, done_queue)),
+    ]
+    for _ in range(count):
+        await download_queue.put(object())
+    for phase_queue in (download_queue, resize_queue, upload_queue):
+        await phase_queue.join()
+    for phase in phases:
+        phase.cancel()
+    return done_queue.qsize()
+
+# Joining each queue in order waits for every phase to drain, just like the
+# threaded version. Cancelling the tasks then plays the role of close.
+
+print(run_event_loop(run_pipeline(1000)), 'item finished')
+# 1000 item finished
+
+
 # Things to remember
 
 # 1. Pipelines are a great way to organize sequences of work that run
@@ -353,13 +353,13 @@ class Grid(object):
 def live_a_generation(grid, sim):
     progeny = Grid(grid.height, grid.width)
     item = next(sim)
-    while item is (not TICK):
+    while item is not TICK:
         if isinstance(item, Query):
             state = grid.query(item.y, item.x)
             item = sim.send(state)
         else:
             progeny.assign(item.y, item.x, item.state)
-            item.next(sim)
+            item = next(sim)
     return progeny
 
 
@@ -436,9 +436,9 @@ for i in range(5):
 print(colums)
 #     1    |    2    |    3    |    4    |    5
 # ---*-----|---------|---------|---------|---------
-# ----*----|---------|---------|---------|---------
-# --***----|---------|---------|---------|---------
-# ---------|---------|---------|---------|---------
+# ----*----|--*-*----|----*----|---*-----|----*----
+# --***----|---**----|--*-*----|----**---|-----*---
+# ---------|---*-----|---**----|---**----|---***---
 # ---------|---------|---------|---------|---------
 
 